@@ -9,6 +9,7 @@ from math import ceil, floor, inf
 # User-defined modules
 from ..core.game import ConnectFourGame
 from .interface import ConnectFourAI
+from .threats import ThreatAnalysis
 from ..utilities import js_callback
 
 class MinimaxAI(ConnectFourAI):
@@ -20,12 +21,14 @@ class MinimaxAI(ConnectFourAI):
     def __init__(self, ai_player_id: int, game: ConnectFourGame):
         super().__init__(ai_player_id, game, "Minimax AI")
 
-    def _get_game_node_children(self, game_node: ConnectFourGame):
+    def _get_game_node_children(self, game_node: ConnectFourGame, col_nums: 'list[int]' = None):
         """
         Gets the resulting states of every available move from the current game node, alongside the column
         numbers associated with the moves that created these states.
 
         :param `game_node`: Contains the current state of the game.
+        :param `col_nums`: Column numbers of the moves to get the resulting states of. If none are provided,
+        every available move will be used instead.
 
         :return: List of tuples (col_num, child_node), where col_num is the column number associated with a
         move, while the child_node is the resulting game state of that move.
@@ -33,7 +36,7 @@ class MinimaxAI(ConnectFourAI):
 
         children = []
         for col_num, available_row in enumerate(game_node.grid.available_col_spaces):
-            if available_row is not None:
+            if available_row is not None and (col_nums is None or col_num in col_nums):
                 child_node = deepcopy(game_node)
                 child_node.drop_disc(col_num)
                 children.append((col_num, child_node))
@@ -66,6 +69,24 @@ class MinimaxAI(ConnectFourAI):
 
         return player_four_in_a_rows
 
+    def _get_victory_value(self, winner_id: int, search_depth: int):
+        """
+        Gets the heuristic value of a game node in which the given player has won.
+
+        :param `winner_id`: Id of the player who has won the game.
+        :param `search_depth`: The remaining search depth at which the victory was reached.
+
+        :return: Integer representing the optimality of the victory (or defeat) for the AI player.
+        """
+
+        # Victory or defeat with a higher depth value is more desirable, because it means less moves are used to reach it
+        depth_points = 2520 / (10 - search_depth)
+
+        if winner_id == self.ai_player_id:
+            return self.winner_heuristic_value + depth_points      # Means AI player has won
+        else:
+            return -self.winner_heuristic_value - depth_points     # Means AI player has lost
+
     def heuristic_function(self, game_node: ConnectFourGame, search_depth: int):
         """
         The heuristic function applied to a game node to assign a ranking for how optimal the grid's state is
@@ -76,9 +97,6 @@ class MinimaxAI(ConnectFourAI):
         :return: Integer representing the optimality of a grid's state for the AI player.
         """
 
-        # Victory or defeat with a higher depth value is more desirable, because it means less moves are used to reach it
-        depth_points = 2520 / (10 - search_depth)
-
         if game_node.winner_id is None:
             # Evaluates empty spaces for any player that is one disc away from a victory
             player_four_in_a_rows = self._determine_near_x_in_a_rows(game_node, game_node.victory_condition)
@@ -87,8 +105,18 @@ class MinimaxAI(ConnectFourAI):
                 player_four_in_a_rows[player_id]
                 for player_id in filter(lambda player_id: player_id != self.ai_player_id, player_four_in_a_rows)
             ])
-            if ai_count - other_player_count != 0:
-                return (ai_count - other_player_count) * 20
+            threat_points = (ai_count - other_player_count) * 20
+
+            # Evaluates odd/even threats that decide the game by zugzwang once the rest of the grid fills up
+            zugzwang_threats = ThreatAnalysis(game_node).get_zugzwang_threats()
+            ai_count = zugzwang_threats.get(self.ai_player_id, 0)
+            other_player_count = sum([
+                zugzwang_threats[player_id]
+                for player_id in filter(lambda player_id: player_id != self.ai_player_id, zugzwang_threats)
+            ])
+            threat_points += (ai_count - other_player_count) * 30
+            if threat_points != 0:
+                return threat_points
 
             # Evaluates grid positioning, granting bonus points for discs closer to the center of the grid
             max_deviation = floor(game_node.grid.width / 4.0)
@@ -108,10 +136,8 @@ class MinimaxAI(ConnectFourAI):
                 return (ai_count - other_player_count) * 2
 
             return 0
-        elif game_node.winner_id == self.ai_player_id:
-            return self.winner_heuristic_value + depth_points      # Means AI player has won
         else:
-            return -self.winner_heuristic_value - depth_points     # Means AI player has lost
+            return self._get_victory_value(game_node.winner_id, search_depth)
 
     def minimax(self, game_node: ConnectFourGame, search_depth: int, alpha: int, beta: int):
         """
@@ -130,6 +156,16 @@ class MinimaxAI(ConnectFourAI):
         if search_depth == 0 or game_node.winner_id is not None or game_node.grid.is_grid_full():
             return self.heuristic_function(game_node, search_depth)
 
+        # Returns proven result of forced wins and double threats without searching any further
+        threat_analysis = ThreatAnalysis(game_node)
+        forced_result = threat_analysis.get_forced_result()
+        if forced_result is not None:
+            winner_id, moves = forced_result
+            return self._get_victory_value(winner_id, search_depth - moves)
+
+        # Only searches moves that are not forced wins, forced blocks, or moves that hand the opponent a win
+        col_nums = threat_analysis.get_candidate_cols()
+
         # AI player wants to maximize gains while opponent wants to minimize it
         maximizing_player = game_node.current_player == self.ai_player_id
         value = -inf if maximizing_player else inf
@@ -137,14 +173,14 @@ class MinimaxAI(ConnectFourAI):
         # Maximizing player will want to maximize values, minimizing player will want to do the opposite
         if maximizing_player:
             value = -inf
-            for _, child_node in self._get_game_node_children(game_node):
+            for _, child_node in self._get_game_node_children(game_node, col_nums):
                 value = max(value, self.minimax(child_node, search_depth - 1, alpha, beta))
                 alpha = max(alpha, value)
                 if alpha >= beta:
                     break   # Beta cutoff
         else:
             value = inf
-            for _, child_node in self._get_game_node_children(game_node):
+            for _, child_node in self._get_game_node_children(game_node, col_nums):
                 value = min(value, self.minimax(child_node, search_depth - 1, alpha, beta))
                 beta = min(beta, value)
                 if beta <= alpha:
@@ -156,8 +192,13 @@ class MinimaxAI(ConnectFourAI):
     def get_optimal_col(self, search_depth = 4):
         col_value_pair = []
 
-        # Evaluates every available move using minimax
-        for col_num, child_node in self._get_game_node_children(self.game):
+        # Plays forced moves straight away, since there is nothing to search
+        col_nums = ThreatAnalysis(self.game).get_candidate_cols()
+        if len(col_nums) == 1:
+            return col_nums[0]
+
+        # Evaluates every candidate move using minimax
+        for col_num, child_node in self._get_game_node_children(self.game, col_nums):
             value = self.minimax(child_node, search_depth, -inf, inf)
             col_value_pair.append((col_num, value))
         
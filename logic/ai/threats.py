@@ -0,0 +1,146 @@
+"""
+Contains static threat analysis for Connect Four positions, which allows an AI to detect forced moves (immediate wins,
+forced blocks and double threats) and odd/even threats that decide zugzwang, without having to search the game tree.
+"""
+
+# User-defined modules
+from ..core.game import ConnectFourGame
+
+class ThreatAnalysis:
+    """
+    Analyzes the threats on a single Connect Four game node. A threat is an empty space that would complete a line of
+    discs meeting the victory condition for a given player if that player were to drop a disc in it.
+    """
+
+    def __init__(self, game_node: ConnectFourGame):
+        self.game_node = game_node
+        self.current_player_id = game_node.current_player
+        self.next_player_id = (game_node.current_player + 1) % len(game_node.players)
+
+        # Blocks and double threats only force the game when a single opponent gets to move next
+        self.is_two_player = len(game_node.players) == 2
+
+        # Caches immediate wins per player, since they are needed for both forced results and candidate moves
+        self._winning_cols = {}
+
+    def is_threat(self, col: int, row: int, player_id: int):
+        """
+        Checks whether the given empty space would complete a line of discs for the given player.
+
+        :param `col`: Column of the empty space being checked.
+        :param `row`: Row of the empty space being checked.
+        :param `player_id`: Player id whose discs are being checked for.
+
+        :return: True if the given player would win by dropping a disc in the given space, False otherwise.
+        """
+
+        grid = self.game_node.grid
+        if row < 0 or row >= grid.height or col < 0 or col >= grid.width:
+            return False
+        if grid.grid_spaces[col][row].disc is not None:
+            return False
+
+        return self.game_node.check_for_discs_in_row(row, col, self.game_node.victory_condition, player_id) is not None
+
+    def get_winning_cols(self, player_id: int):
+        """
+        Gets the columns in which the given player would win immediately by dropping a disc.
+
+        :param `player_id`: Player id whose immediate wins are being looked for.
+
+        :return: List of column numbers whose next available space is a threat for the given player.
+        """
+
+        if player_id not in self._winning_cols:
+            self._winning_cols[player_id] = [
+                col for col, available_row in enumerate(self.game_node.grid.available_col_spaces)
+                if available_row is not None and self.is_threat(col, available_row, player_id)
+            ]
+
+        return self._winning_cols[player_id]
+
+    def get_forced_result(self):
+        """
+        Determines whether the game node has a proven result that does not require any search. The current player
+        wins on the next move if they have an immediate win, otherwise they lose on the move after if their opponent
+        has at least two immediate wins (a double threat), since only one of them can be blocked.
+
+        :return: Tuple (winner_id, moves), where winner_id is the id of the player with a proven win and moves is the
+        number of moves needed to reach it, or None if the result cannot be determined statically.
+        """
+
+        if len(self.get_winning_cols(self.current_player_id)) > 0:
+            return (self.current_player_id, 1)
+
+        if self.is_two_player and len(self.get_winning_cols(self.next_player_id)) > 1:
+            return (self.next_player_id, 2)
+
+        return None
+
+    def get_candidate_cols(self):
+        """
+        Gets the columns that are worth searching for the current player. An immediate win is played straight away and
+        a single opponent threat must be blocked. Otherwise, moves that would allow the opponent to win by playing on
+        top of them are discarded, unless every available move does so.
+
+        :return: List of column numbers that are worth searching for the current player.
+        """
+
+        available_cols = [
+            col for col, available_row in enumerate(self.game_node.grid.available_col_spaces) if available_row is not None
+        ]
+
+        winning_cols = self.get_winning_cols(self.current_player_id)
+        if len(winning_cols) > 0:
+            return winning_cols[:1]
+
+        if not self.is_two_player:
+            return available_cols
+
+        blocking_cols = self.get_winning_cols(self.next_player_id)
+        if len(blocking_cols) == 1:
+            return blocking_cols
+        elif len(blocking_cols) > 1:
+            return available_cols   # Game is lost regardless, so every move is left for the search to rank
+
+        # Discards moves that fill the space right below an opponent's threat
+        available_row_spaces = self.game_node.grid.available_col_spaces
+        safe_cols = [
+            col for col in available_cols if not self.is_threat(col, available_row_spaces[col] + 1, self.next_player_id)
+        ]
+
+        return safe_cols if len(safe_cols) > 0 else available_cols
+
+    def get_zugzwang_threats(self):
+        """
+        Counts the threats of each player that would decide the game by zugzwang once the rest of the grid fills up.
+        In a two player game on a grid with an even height, the first player is able to claim the odd rows (counting
+        from the bottom row as row one) and the second player the even rows, so only threats on those rows count.
+        A threat is also discarded when either player has a claimable threat lower down in the same column, since
+        that threat would be reached first.
+
+        :return: Dictionary mapping each player id to their number of zugzwang threats, which is empty when the odd/even
+        rules do not apply to the game.
+        """
+
+        grid = self.game_node.grid
+        if not self.is_two_player or grid.height % 2 != 0:
+            return {}
+
+        first_player_id, second_player_id = [player.id for player in self.game_node.players]
+        zugzwang_threats = { first_player_id : 0, second_player_id : 0 }
+
+        for col, available_row in enumerate(grid.available_col_spaces):
+            if available_row is None:
+                continue
+
+            # Only the lowest claimable threat in the column matters, since the column is decided once it is reached
+            for row in range(available_row, grid.height):
+                if row % 2 == 0 and self.is_threat(col, row, first_player_id):
+                    zugzwang_threats[first_player_id] += 1
+                    break
+                if row % 2 == 1 and self.is_threat(col, row, second_player_id):
+                    zugzwang_threats[second_player_id] += 1
+                    break
+
+        return zugzwang_threats